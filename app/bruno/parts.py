@@ -1,15 +1,44 @@
+from __future__ import annotations
+
 import enum
 import json
+import textwrap
+from dataclasses import dataclass, field
 from http import HTTPMethod
 from pathlib import Path
-from typing import Self, Any, Union
-
-from pydantic import BaseModel, Field
+from typing import Self, Any
 
 from app.common import RequestBodyType, ParamPlacement
 
 INDENT = ' ' * 2
 
+_CONFIG_TEMPLATE = '\n'.join([
+    '{method} {{',
+    INDENT + 'url: {{{{host}}}}{url}/',
+    INDENT + 'body: {body}',
+    INDENT + 'auth: {auth}',
+    '}}',
+])
+_HEADERS_TEMPLATE = '\n'.join([
+    'headers {{',
+    INDENT + 'Content-Type: {content_type}',
+    '}}',
+])
+_META_TEMPLATE = '\n'.join([
+    'meta {{',
+    INDENT + 'name: {name}',
+    INDENT + 'type: {type}',
+    INDENT + 'seq: {seq}',
+    '}}',
+])
+_DOCS_TEMPLATE = '\n'.join([
+    'docs {{',
+    INDENT + '{description}',
+    '}}',
+])
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+_SELECTION_PREFIXES = ('~', '')
+
 
 class RequestAuthType(enum.Enum):
     NONE = 'none'
@@ -33,43 +62,44 @@ class AttributeType(enum.Enum):
         if 'type' in value:
             return cls[value['type'].upper()]
 
-        return {
-            int: cls.INTEGER,
-            str: cls.STRING,
-        }[type(value['enum'][0])]
+        return _ENUM_VALUE_TYPES[type(value['enum'][0])]
 
 
-class EndpointConfig(BaseModel):
+_ENUM_VALUE_TYPES = {
+    int: AttributeType.INTEGER,
+    str: AttributeType.STRING,
+}
+
+
+@dataclass(slots=True)
+class EndpointConfig:
     http_method: HTTPMethod | None = None
     url: Path | str | None = None
     body_type: RequestBodyType | None = None
     auth_type: RequestAuthType | None = None
 
     def to_bru(self) -> str:
-        return '\n'.join([
-            f'{self.http_method.lower()} {{',
-            f'{INDENT}url: {{{{host}}}}{self.url}/',
-            f'{INDENT}body: {getattr(self.body_type, "value", "none")}',
-            f'{INDENT}auth: {getattr(self.auth_type, "value", "none")}',
-            '}',
-        ])
+        return _CONFIG_TEMPLATE.format(
+            method=self.http_method.lower(),
+            url=self.url,
+            body=getattr(self.body_type, 'value', 'none'),
+            auth=getattr(self.auth_type, 'value', 'none'),
+        )
 
 
-class RequestHeaders(BaseModel):
+@dataclass(slots=True)
+class RequestHeaders:
     content_type: str | None = None
 
     def to_bru(self) -> str:
         if not self.content_type:
             return ''
 
-        return '\n'.join([
-            'headers {',
-            f'{INDENT}Content-Type: {self.content_type}',
-            '}'
-        ])
+        return _HEADERS_TEMPLATE.format(content_type=self.content_type)
 
 
-class RequestPayloadItem(BaseModel):
+@dataclass(slots=True)
+class RequestPayloadItem:
     name: str
     default_value: Any = ''
     required: bool = False
@@ -78,29 +108,33 @@ class RequestPayloadItem(BaseModel):
     item_type: str | dict | None = None
 
     def to_bru(self) -> str:
-        sel = '' if self.selected else '~'
-        return f"{sel}{self.name}: {self.default_value or ''}"
+        return f"{_SELECTION_PREFIXES[self.selected]}{self.name}: {self.default_value or ''}"
 
 
+@dataclass(slots=True)
 class QueryParameter(RequestPayloadItem):
     pass
 
 
+@dataclass(slots=True)
 class BodyProperty(RequestPayloadItem):
     pass
 
 
+@dataclass(slots=True)
 class EndpointVar(RequestPayloadItem):
     pass
 
 
-class RequestNestedItem(BaseModel):
+@dataclass(slots=True)
+class RequestNestedItem:
     name: str
-    items: list[Union[RequestPayloadItem, 'RequestNestedItem']] = Field(default_factory=list)
+    items: list[RequestPayloadItem | RequestNestedItem] = field(default_factory=list)
 
 
-class RequestQuery(BaseModel):
-    params: list[QueryParameter] | None = Field(default_factory=list)
+@dataclass(slots=True)
+class RequestQuery:
+    params: list[QueryParameter] | None = field(default_factory=list)
 
     def to_bru(self) -> str:
         if not self.params:
@@ -108,15 +142,16 @@ class RequestQuery(BaseModel):
 
         return '\n'.join([
             'query {',
-            *[f'{INDENT}{p.to_bru()}' for p in self.params],
+            *(f'{INDENT}{p.to_bru()}' for p in self.params),
             '}'
         ])
 
 
-class RequestBody(BaseModel):
+@dataclass(slots=True)
+class RequestBody:
     body_type: RequestBodyType | None = None
     # content_type: str | None = None
-    props: list[BodyProperty | RequestNestedItem] | None = Field(default_factory=list)
+    props: list[BodyProperty | RequestNestedItem] | None = field(default_factory=list)
     json_data: dict | None = None
 
     def to_bru(self) -> str:
@@ -131,80 +166,76 @@ class RequestBody(BaseModel):
 
     def _props_to_bru(self):
         if self.body_type == RequestBodyType.JSON:
-            json_stub = {}
-            for prop in self.props:
-                json_stub[prop.name] = self._prop_to_bru(prop)
-            json_lines = json.dumps(json_stub, indent=2).splitlines()
-            return ['\n'.join([f'{INDENT}{line}' for line in json_lines])]
+            return [textwrap.indent(_JSON_ENCODER.encode(self._json_stub()), INDENT)]
         else:
             return [f'{INDENT}{p.to_bru()}' for p in self.props]
 
-    def _prop_to_bru(self, prop: BodyProperty | RequestNestedItem):
-        if isinstance(prop, BodyProperty):
-            return prop.default_value
-        elif isinstance(prop, RequestNestedItem):
-            return {
-                nested_prop.name: self._prop_to_bru(nested_prop)
-                for nested_prop in prop.items
-            }
-        else:
-            raise ValueError(f'Unknown property type: {type(prop)}')
+    def _json_stub(self) -> dict:
+        json_stub = {}
+        pending = [(json_stub, self.props)]
 
+        while pending:
+            stub, props = pending.pop()
+            for prop in props:
+                if isinstance(prop, BodyProperty):
+                    stub[prop.name] = prop.default_value
+                elif isinstance(prop, RequestNestedItem):
+                    stub[prop.name] = nested_stub = {}
+                    pending.append((nested_stub, prop.items))
+                else:
+                    raise ValueError(f'Unknown property type: {type(prop)}')
 
-class EndpointVars(BaseModel):
-    pre_request: list[EndpointVar] | None = Field(default_factory=list)
-    post_request: list[EndpointVar] | None = Field(default_factory=list)
+        return json_stub
+
+
+@dataclass(slots=True)
+class EndpointVars:
+    pre_request: list[EndpointVar] | None = field(default_factory=list)
+    post_request: list[EndpointVar] | None = field(default_factory=list)
 
     def to_bru(self):
-        parts = []
+        lines = []
 
         if self.pre_request:
-            parts.append('\n'.join([
-                'vars:pre-request {',
-                *[f'{INDENT}{v.to_bru()}' for v in self.pre_request],
-                '}'
-            ]))
+            lines.append('vars:pre-request {')
+            lines.extend(f'{INDENT}{v.to_bru()}' for v in self.pre_request)
+            lines.append('}')
 
         if self.post_request:
-            parts.append('\n'.join([
-                'vars:post-request {',
-                *[f'{INDENT}{v.to_bru()}' for v in self.post_request],
-                '}'
-            ]))
+            lines.append('vars:post-request {')
+            lines.extend(f'{INDENT}{v.to_bru()}' for v in self.post_request)
+            lines.append('}')
 
-        return '\n'.join(parts)
+        return '\n'.join(lines)
 
 
-class EndpointMeta(BaseModel):
+@dataclass(slots=True)
+class EndpointMeta:
     endpoint_name: str | None = None
     endpoint_type: EndpointType | None = None
     sequence: int | None = None
 
     def to_bru(self) -> str:
-        return '\n'.join([
-            'meta {',
-            f'{INDENT}name: {self.endpoint_name}',
-            f'{INDENT}type: {self.endpoint_type.value}',
-            f'{INDENT}seq: {self.sequence}',
-            '}'
-        ])
+        return _META_TEMPLATE.format(
+            name=self.endpoint_name,
+            type=self.endpoint_type.value,
+            seq=self.sequence,
+        )
 
 
-class EndpointDocs(BaseModel):
+@dataclass(slots=True)
+class EndpointDocs:
     description: str | None = None
 
     def to_bru(self) -> str:
         if not self.description:
             return ''
 
-        return '\n'.join([
-            'docs {',
-            f'{INDENT}{self.description}',
-            '}'
-        ])
+        return _DOCS_TEMPLATE.format(description=self.description)
 
 
-class BrunoEndpoint(BaseModel):
+@dataclass(slots=True)
+class BrunoEndpoint:
     meta: EndpointMeta | None = None
     config: EndpointConfig | None = None
     headers: RequestHeaders | None = None
@@ -214,11 +245,14 @@ class BrunoEndpoint(BaseModel):
     docs: EndpointDocs | None = None
 
     def to_bru(self) -> str:
-        return '\n\n'.join([
-            part.to_bru() for part
-            in self._blocks_order()
-            if part and part.to_bru()
-        ]) + '\n'
+        blocks = []
+        for part in self._blocks_order():
+            if part is None:
+                continue
+            if rendered := part.to_bru():
+                blocks.append(rendered)
+
+        return '\n\n'.join(blocks) + '\n'
 
     def _blocks_order(self) -> tuple:
         return (
@@ -231,5 +265,3 @@ class BrunoEndpoint(BaseModel):
             self.docs,
         )
 
-
-RequestNestedItem.update_forward_refs()
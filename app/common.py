@@ -1,4 +1,5 @@
 import enum
+import functools
 from typing import Self
 
 
@@ -8,21 +9,24 @@ class RequestBodyType(enum.Enum):
     FORM_URL_ENCODED = 'formUrlEncoded'
 
     @classmethod
+    @functools.lru_cache(maxsize=32)
     def from_content_type(cls, content_type: str | None) -> Self:
-        match content_type:
-            case 'application/x-www-form-urlencoded':
-                return cls.FORM_URL_ENCODED
-            case None:
-                return None
-            case _:
-                return cls.JSON
+        return _CONTENT_TYPES.get(content_type, cls.JSON)
 
     def body_block_type(self, request_type: Self) -> str:
-        return {
-            self.NONE: self.NONE.value,
-            self.JSON: self.JSON.value,
-            self.FORM_URL_ENCODED: 'form-urlencoded',
-        }[request_type]
+        return _BODY_BLOCK_TYPES[request_type]
+
+
+_CONTENT_TYPES = {
+    'application/x-www-form-urlencoded': RequestBodyType.FORM_URL_ENCODED,
+    None: None,
+}
+
+_BODY_BLOCK_TYPES = {
+    RequestBodyType.NONE: RequestBodyType.NONE.value,
+    RequestBodyType.JSON: RequestBodyType.JSON.value,
+    RequestBodyType.FORM_URL_ENCODED: 'form-urlencoded',
+}
 
 
 class ParamPlacement(enum.Enum):
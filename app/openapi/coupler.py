@@ -1,65 +1,85 @@
+import asyncio
 from pathlib import Path
 
-import aiofiles
-
 from app.bruno import parts as bru_parts
 from app.common import RequestBodyType, ParamPlacement
 from app.openapi.parts import API as OpenAPI, Endpoint as OpenAPIEndpoint, Parameter as OpenAPIParameter, \
-    NestedObject as OpenAPINestedObject
+    NestedObject as OpenAPINestedObject, Body as OpenAPIBody
+
+_PARAM_CLASSES = {
+    None: bru_parts.BodyProperty,
+    ParamPlacement.PATH: bru_parts.EndpointVar,
+    ParamPlacement.QUERY: bru_parts.QueryParameter,
+    ParamPlacement.HEADER: None,
+}
 
 
 class OpenAPICoupler:
     _BRU_FILE_SUFFIX = '.bru'
+    _WRITE_BATCH_SIZE = 64
 
     def __init__(self, api_data: OpenAPI, root_folder: Path):
         self._api_data = api_data
         self._root_folder = root_folder
-        self._sequence_number: int = 0
+        self._created_dirs: set[Path] = set()
 
     async def couple(self):
+        bru_files: dict[Path, str] = {}
+        sequence_number = 0
+
         for _, openapi_path in self._api_data.paths.items():
-            self._make_path_dirs(openapi_path.path)
+            path_dir = self._make_path_dirs(openapi_path.path)
 
             for oa_endpoint in openapi_path.endpoints:
-                self._sequence_number += 1
-                method_filename = self._get_method_filename(oa_endpoint)
-                bru_endpoint = self._couple_endpoint(oa_endpoint)
-                await self.write_to_file(bru_endpoint, method_filename)
+                sequence_number += 1
+                method_filename = self._get_method_filename(oa_endpoint, path_dir)
+                bru_endpoint = self._couple_endpoint(oa_endpoint, sequence_number)
+                bru_files[method_filename] = bru_endpoint.to_bru()
+
+        files = list(bru_files.items())
+        await asyncio.gather(*(
+            asyncio.to_thread(self._write_files, files[start:start + self._WRITE_BATCH_SIZE])
+            for start in range(0, len(files), self._WRITE_BATCH_SIZE)
+        ))
+
+    def _couple_endpoint(self, endpoint: OpenAPIEndpoint, sequence_number: int):
+        content_type = self._get_body_content_type(endpoint)
+        body_type = RequestBodyType.from_content_type(content_type)
+        query_params, path_params = self._partition_params(endpoint)
 
-    def _couple_endpoint(self, endpoint: OpenAPIEndpoint):
         return bru_parts.BrunoEndpoint(
-            meta=self._couple_meta(endpoint),
-            config=self._couple_config(endpoint),
-            headers=self._couple_headers(endpoint),
-            body=self._couple_body(endpoint),
-            query=self._couple_query(endpoint),
-            vars=self._couple_vars(endpoint),
+            meta=self._couple_meta(endpoint, sequence_number),
+            config=self._couple_config(endpoint, content_type),
+            headers=self._couple_headers(content_type),
+            body=self._couple_body(endpoint, body_type),
+            query=self._couple_query(query_params),
+            vars=self._couple_vars(path_params),
             docs=self._couple_docs(endpoint),
         )
 
-    def _couple_meta(self, endpoint: OpenAPIEndpoint):
+    def _couple_meta(self, endpoint: OpenAPIEndpoint, sequence_number: int):
         return bru_parts.EndpointMeta(
             endpoint_name=endpoint.path.stem,
             endpoint_type=bru_parts.EndpointType.HTTP,
-            sequence=self._sequence_number,
+            sequence=sequence_number,
         )
 
-    def _couple_config(self, endpoint: OpenAPIEndpoint):
+    def _couple_config(self, endpoint: OpenAPIEndpoint, content_type: RequestBodyType | None):
         return bru_parts.EndpointConfig(
             http_method=endpoint.method,
             url=endpoint.path,
-            body_type=self._get_body_content_type(endpoint),
+            body_type=content_type,
         )
 
-    def _couple_headers(self, endpoint: OpenAPIEndpoint):
+    def _couple_headers(self, content_type: RequestBodyType | None):
         return bru_parts.RequestHeaders(
-            content_type=self._get_body_content_type(endpoint),
+            content_type=getattr(content_type, 'value', None),
         )
 
-    def _couple_body(self, endpoint: OpenAPIEndpoint):
-        match self._get_request_body_type(endpoint):
+    def _couple_body(self, endpoint: OpenAPIEndpoint, body_type: RequestBodyType | None):
+        match body_type:
             case RequestBodyType.JSON as body_type:
-                props = self._couple_body_json(endpoint)
+                props = self._couple_body_json(endpoint.body)
             case None as body_type:
                 props = None
             case body_type:
@@ -70,22 +90,14 @@ class OpenAPICoupler:
             props=props,
         )
 
-    def _couple_query(self, endpoint: OpenAPIEndpoint):
+    def _couple_query(self, query_params: list[bru_parts.QueryParameter]):
         return bru_parts.RequestQuery(
-            params=[
-                self._couple_payload_item(parameter)
-                for parameter in getattr(endpoint.query, 'parameters', [])
-                if parameter.placement is ParamPlacement.QUERY
-            ]
+            params=query_params,
         )
 
-    def _couple_vars(self, endpoint: OpenAPIEndpoint):
+    def _couple_vars(self, path_params: list[bru_parts.EndpointVar]):
         return bru_parts.EndpointVars(
-            pre_request=[
-                self._couple_payload_item(parameter)
-                for parameter in getattr(endpoint.query, 'parameters', [])
-                if parameter.placement is ParamPlacement.PATH
-            ]
+            pre_request=path_params,
         )
 
     def _couple_docs(self, endpoint: OpenAPIEndpoint):
@@ -93,11 +105,20 @@ class OpenAPICoupler:
             description=endpoint.description,
         )
 
-    def _couple_body_json(self, endpoint: OpenAPIEndpoint):
-        return [
-            self._couple_payload_item(parameter)
-            for parameter in getattr(endpoint.body, 'payload', [])
-        ]
+    def _partition_params(self, endpoint: OpenAPIEndpoint):
+        query_params, path_params = [], []
+
+        for parameter in getattr(endpoint.query, 'parameters', []):
+            if parameter.placement is ParamPlacement.QUERY:
+                query_params.append(self._couple_payload_item(parameter))
+            elif parameter.placement is ParamPlacement.PATH:
+                path_params.append(self._couple_payload_item(parameter))
+
+        return query_params, path_params
+
+    def _couple_body_json(self, body: OpenAPIBody):
+        couple = self._couple_payload_item
+        return [couple(parameter) for parameter in body.payload]
 
     def _couple_payload_item(self, item: OpenAPIParameter | OpenAPINestedObject):
         if isinstance(item, OpenAPINestedObject):
@@ -122,30 +143,21 @@ class OpenAPICoupler:
     def _get_body_content_type(endpoint: OpenAPIEndpoint):
         return getattr(endpoint.body, 'content_type', None)
 
-    def _get_request_body_type(self, endpoint: OpenAPIEndpoint):
-        return bru_parts.RequestBodyType.from_content_type(
-            self._get_body_content_type(endpoint)
-        )
-
     @staticmethod
     def _get_param_class(placement: ParamPlacement | None):
-        return {
-            None: bru_parts.BodyProperty,
-            ParamPlacement.PATH: bru_parts.EndpointVar,
-            ParamPlacement.QUERY: bru_parts.QueryParameter,
-            ParamPlacement.HEADER: '',
-        }[placement]
-
-    def _make_path_dirs(self, path: Path):
+        return _PARAM_CLASSES[placement]
+
+    def _make_path_dirs(self, path: Path) -> Path:
         path_dir = self._root_folder / path.relative_to('/')
-        path_dir.mkdir(parents=True, exist_ok=True)
+        if path_dir not in self._created_dirs:
+            path_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.update((path_dir, *path_dir.parents))
+        return path_dir
 
-    def _get_method_filename(self, endpoint: OpenAPIEndpoint):
-        return self._root_folder.joinpath(
-            endpoint.path.relative_to('/'), endpoint.method.lower()
-        ).with_suffix(self._BRU_FILE_SUFFIX)
+    def _get_method_filename(self, endpoint: OpenAPIEndpoint, path_dir: Path):
+        return path_dir / f'{endpoint.method.lower()}{self._BRU_FILE_SUFFIX}'
 
     @staticmethod
-    async def write_to_file(endpoint: bru_parts.BrunoEndpoint, file_path: Path):
-        async with aiofiles.open(file_path, 'w') as f:
-            await f.write(endpoint.to_bru())
+    def _write_files(files: list[tuple[Path, str]]):
+        for file_path, content in files:
+            file_path.write_text(content, encoding='utf-8')
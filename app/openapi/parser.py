@@ -1,3 +1,4 @@
+import functools
 import pathlib
 from typing import Callable
 
@@ -7,99 +8,53 @@ import app.common
 from app.common import RequestBodyType
 from app.openapi import parts
 
+_METHODS_WITH_BODY = {HTTPMethod.POST, HTTPMethod.PUT, HTTPMethod.DELETE}
+
 
 class OpenAPIParser:
     def __init__(self, schema: dict):
         self._raw_schema = schema
         self.api_name = schema['info']['title']
         self.parsed_api = parts.API()
+        self._schema_from_ref = functools.lru_cache(maxsize=None)(self._resolve_ref)
+        self._method_parsers = {
+            method: functools.partial(self._parse_endpoint, method=method)
+            for method in (HTTPMethod.GET, HTTPMethod.POST, HTTPMethod.PUT, HTTPMethod.DELETE)
+        }
+        self._body_parsers = {
+            RequestBodyType.NONE: None,
+            RequestBodyType.JSON: self._parse_body_json,
+            RequestBodyType.FORM_URL_ENCODED: self._parse_body_form_url_encoded,
+        }
+        self._param_parsers = {
+            app.common.ParamPlacement.PATH: self._parse_path_param,
+            app.common.ParamPlacement.QUERY: self._parse_query_param,
+            app.common.ParamPlacement.HEADER: self._parse_header_param,
+        }
 
     def parse(self):
         for path, methods in self._raw_schema['paths'].items():
             if '{' in path:
                 path = self.dup_fig_par(path)
-            parsed_path = parts.Path(path=pathlib.Path(path))
+            endpoint_path = pathlib.Path(path)
+            parsed_path = parts.Path(path=endpoint_path)
             for method_name, method_data in methods.items():
                 parser = self._method_parser(HTTPMethod(method_name.upper()))
-                parsed_path.endpoints.append(parser(path, method_data))
+                parsed_path.endpoints.append(parser(endpoint_path, method_data))
             self.parsed_api.paths[path] = parsed_path
         return self.parsed_api
 
     def _method_parser(self, method: HTTPMethod) -> Callable:
-        return {
-            HTTPMethod.GET: self._parse_get,
-            HTTPMethod.POST: self._parse_post,
-            HTTPMethod.PUT: self._parse_put,
-            HTTPMethod.DELETE: self._parse_delete,
-        }[method]
+        return self._method_parsers[method]
 
     def _body_parser(self, type_: RequestBodyType) -> Callable | None:
-        return {
-            RequestBodyType.NONE: None,
-            RequestBodyType.JSON: self._parse_body_json,
-            RequestBodyType.FORM_URL_ENCODED: self._parse_body_form_url_encoded,
-        }[type_]
-
-    def _parse_get(self, path: str, data: dict) -> parts.Endpoint:
-        endpoint = parts.Endpoint(
-            path=pathlib.Path(path),
-            method=HTTPMethod.GET,
-            description=data.get('summary') or data('description'),
-        )
-
-        parameters = [
-            self._parse_parameter(parameter_data)
-            for parameter_data in data.get('parameters', [])
-        ]
-
-        if parameters:
-            endpoint.query = parts.Query(parameters=parameters)
-
-        return endpoint
-
-    def _parse_post(self, path: str, data: dict) -> parts.Endpoint:
-        endpoint = parts.Endpoint(
-            path=pathlib.Path(path),
-            method=HTTPMethod.POST,
-            description=data.get('summary') or data('description'),
-        )
-
-        if parameters := [
-            self._parse_parameter(parameter_data)
-            for parameter_data in data.get('parameters', [])
-        ]:
-            endpoint.query = parts.Query(parameters=parameters)
-
-        if raw_body := data.get('requestBody'):
-            endpoint.body = self._parse_body(raw_body)
-
-        return endpoint
-
-    def _parse_put(self, path: str, data: dict) -> parts.Endpoint:
-        endpoint = parts.Endpoint(
-            path=pathlib.Path(path),
-            method=HTTPMethod.PUT,
-            description=data.get('summary') or data('description'),
-        )
-
-        parameters = [
-            self._parse_parameter(parameter_data)
-            for parameter_data in data.get('parameters', [])
-        ]
+        return self._body_parsers[type_]
 
-        if parameters:
-            endpoint.query = parts.Query(parameters=parameters)
-
-        if raw_body := data.get('requestBody'):
-            endpoint.body = self._parse_body(raw_body)
-
-        return endpoint
-
-    def _parse_delete(self, path: str, data: dict) -> parts.Endpoint:
+    def _parse_endpoint(self, path: pathlib.Path, data: dict, method: HTTPMethod) -> parts.Endpoint:
         endpoint = parts.Endpoint(
-            path=pathlib.Path(path),
-            method=HTTPMethod.DELETE,
-            description=data.get('summary') or data('description'),
+            path=path,
+            method=method,
+            description=data.get('summary') or data.get('description'),
         )
 
         if parameters := [
@@ -108,15 +63,16 @@ class OpenAPIParser:
         ]:
             endpoint.query = parts.Query(parameters=parameters)
 
-        if raw_body := data.get('requestBody'):
+        if method in _METHODS_WITH_BODY and (raw_body := data.get('requestBody')):
             endpoint.body = self._parse_body(raw_body)
 
         return endpoint
 
     def _parse_body(self, data: dict) -> parts.Body:
-        content_type = list(data['content'])[0]
+        content = data['content']
+        content_type = next(iter(content))
         body_type = RequestBodyType.from_content_type(content_type)
-        schema_data = data['content'][content_type]['schema']
+        schema_data = content[content_type]['schema']
         schema_type = schema_data.get('type')
         if schema_type == 'array':
             schema = self._schema_from_ref(schema_data['items']['$ref'])
@@ -140,38 +96,21 @@ class OpenAPIParser:
                     required=(property_name in data.get('required', [])),
                     default=property_data.get('default'),
                 ))
-            else:
-                if all_of := property_data.get('allOf'):
-                    schema = self._schema_from_ref(all_of[0]['$ref'])
-                    if 'enum' in schema:
-                        body.payload.append(self._parse_enum(
-                            name=property_name,
-                            data=property_data,
-                        ))
-                    else:
-                        nested_body = self._parse_body_json(schema)
-                        nested_object = parts.NestedObject(
-                            name=property_name,
-                            parameters=nested_body.payload,
-                        )
-                        body.payload.append(nested_object)
+            elif schema := self._resolve_ref_or_all_of(property_data):
+                if 'enum' in schema:
+                    body.payload.append(self._parse_enum(
+                        name=property_name,
+                        data=property_data,
+                    ))
                 else:
-                    if ref := property_data.get('$ref'):
-                        schema = self._schema_from_ref(ref)
-                        if 'enum' in schema:
-                            body.payload.append(self._parse_enum(
-                                name=property_name,
-                                data=property_data,
-                            ))
-                        else:
-                            nested_body = self._parse_body_json(schema)
-                            nested_object = parts.NestedObject(
-                                name=property_name,
-                                parameters=nested_body.payload,
-                            )
-                            body.payload.append(nested_object)
-                    else:
-                        print()
+                    nested_body = self._parse_body_json(schema)
+                    nested_object = parts.NestedObject(
+                        name=property_name,
+                        parameters=nested_body.payload,
+                    )
+                    body.payload.append(nested_object)
+            else:
+                print()
 
         return body
 
@@ -198,21 +137,14 @@ class OpenAPIParser:
                 print()
         else:
             placement = app.common.ParamPlacement(data['in'])
-            if placement is app.common.ParamPlacement.PATH:
-                parameter = self._parse_path_param(data)
-            elif placement is app.common.ParamPlacement.QUERY:
-                parameter = self._parse_query_param(data)
-            elif placement is app.common.ParamPlacement.HEADER:
-                parameter = self._parse_header_param(data)
-            else:
-                print()
+            parameter = self._param_parsers[placement](data)
 
         return parameter
 
     def _parse_query_param(self, data: dict) -> parts.Parameter:
         schema = data['schema']
-        if '$ref' in data['schema']:
-            schema = self._schema_from_ref(data['schema']['$ref'])
+        if '$ref' in schema:
+            schema = self._schema_from_ref(schema['$ref'])
             if 'enum' in schema:
                 return self._parse_enum(name=data['name'], data=data)
 
@@ -248,11 +180,17 @@ class OpenAPIParser:
             default=data.get('default'),
         )
 
-    def _schema_from_ref(self, rel_path: str) -> dict:
-        path = pathlib.Path(rel_path.removeprefix('#/'))
+    def _resolve_ref_or_all_of(self, data: dict) -> dict | None:
+        if all_of := data.get('allOf'):
+            return self._schema_from_ref(all_of[0]['$ref'])
+        if ref := data.get('$ref'):
+            return self._schema_from_ref(ref)
+        return None
+
+    def _resolve_ref(self, rel_path: str) -> dict:
         schema = self._raw_schema
-        for part in path.parts:
-            schema = schema.get(part)
+        for part in rel_path.removeprefix('#/').split('/'):
+            schema = schema[part]
         return schema
 
     @staticmethod
@@ -1,36 +1,42 @@
-import pathlib
-from typing import Any, Union
+from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import pathlib
+from dataclasses import dataclass, field
+from typing import Any
 
 from http import HTTPMethod
 
 from app.common import RequestBodyType, ParamPlacement
 
 
-class Parameter(BaseModel):
+@dataclass(slots=True)
+class Parameter:
     name: str
     type_: str
-    placement: ParamPlacement | None = None
     required: bool
+    placement: ParamPlacement | None = None
     default: Any = None
 
 
-class NestedObject(BaseModel):
+@dataclass(slots=True)
+class NestedObject:
     name: str
-    parameters: list[Union[Parameter, 'NestedObject']] = Field(default_factory=list)
+    parameters: list[Parameter | NestedObject] = field(default_factory=list)
 
 
-class Query(BaseModel):
-    parameters: list[Parameter] = Field(default_factory=list)
+@dataclass(slots=True)
+class Query:
+    parameters: list[Parameter] = field(default_factory=list)
 
 
-class Body(BaseModel):
+@dataclass(slots=True)
+class Body:
     content_type: RequestBodyType
-    payload: list[Parameter | NestedObject] = Field(default_factory=list)
+    payload: list[Parameter | NestedObject] = field(default_factory=list)
 
 
-class Endpoint(BaseModel):
+@dataclass(slots=True)
+class Endpoint:
     path: pathlib.Path
     method: HTTPMethod
     query: Query | None = None
@@ -38,13 +44,13 @@ class Endpoint(BaseModel):
     description: str | None = None
 
 
-class Path(BaseModel):
+@dataclass(slots=True)
+class Path:
     path: pathlib.Path
-    endpoints: list[Endpoint] = Field(default_factory=list)
-
+    endpoints: list[Endpoint] = field(default_factory=list)
 
-class API(BaseModel):
-    paths: dict[str, Path] | None = Field(default_factory=dict)
 
+@dataclass(slots=True)
+class API:
+    paths: dict[str, Path] | None = field(default_factory=dict)
 
-NestedObject.update_forward_refs()
@@ -4,7 +4,6 @@ import json
 import pathlib
 from pathlib import Path
 
-import aiofiles
 import httpx
 
 from app.openapi.coupler import OpenAPICoupler
@@ -13,12 +12,11 @@ from app.openapi.parser import OpenAPIParser
 
 async def get_raw_openapi(file_path: Path | str) -> dict:
     if isinstance(file_path, Path) and file_path.is_file():
-        async with aiofiles.open(file_path) as f:
-            return json.loads(await f.read())
+        return json.loads(await asyncio.to_thread(file_path.read_bytes))
     elif isinstance(file_path, str) and '://' in file_path:
         async with httpx.AsyncClient() as client:
             response = await client.get(file_path)
-            return json.loads(response.text)
+            return response.json()
     else:
         raise ValueError(f'Unsupported file path type: {file_path}')
 